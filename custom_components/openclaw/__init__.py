@@ -27,10 +27,12 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .api import OpenClawApiClient, OpenClawApiError
 from .const import (
     ATTR_AGENT_ID,
+    ATTR_ENTRY_ID,
     ATTR_MESSAGE,
     ATTR_MODEL,
     ATTR_OK,
@@ -66,6 +68,7 @@ from .const import (
     CONF_VOICE_PROVIDER,
     CONF_THINKING_TIMEOUT,
     CONTEXT_STRATEGY_TRUNCATE,
+    DATA_GATEWAY_VERSION,
     DEFAULT_AGENT_ID,
     DEFAULT_VOICE_AGENT_ID,
     DEFAULT_CONTEXT_MAX_CHARS,
@@ -181,6 +184,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: OpenClawConfigEntry) ->
     # First data fetch — if it fails the coordinator marks entities unavailable
     await coordinator.async_config_entry_first_refresh()
 
+    # One shared DeviceInfo for every entity of this entry — avoids each
+    # platform allocating its own identical dict.
+    hass.data[DOMAIN][entry.entry_id]["device_info"] = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="OpenClaw Assistant",
+        manufacturer="OpenClaw",
+        model="OpenClaw Gateway",
+        sw_version=coordinator.data.get(DATA_GATEWAY_VERSION) if coordinator.data else None,
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Register services (once, idempotent)
@@ -223,7 +236,10 @@ def _async_setup_token_refresh(
     failure during polling, we re-read the token from the shared filesystem
     and update the config entry + client transparently.
     """
-    import json as _json
+    try:
+        from homeassistant.util.json import json_loads as _json_loads
+    except ImportError:  # pragma: no cover
+        _json_loads = json.loads
 
     async def _try_refresh_token() -> bool:
         """Re-read token from filesystem and update client if changed."""
@@ -233,7 +249,7 @@ def _async_setup_token_refresh(
             if not config_file.exists():
                 return None
             try:
-                cfg = _json.loads(config_file.read_text(encoding="utf-8"))
+                cfg = _json_loads(config_file.read_bytes())
                 return cfg.get("gateway", {}).get("auth", {}).get("token")
             except Exception:  # noqa: BLE001
                 return None
@@ -248,8 +264,11 @@ def _async_setup_token_refresh(
             return True
         return False
 
-    # Expose refresh function for the coordinator to call on auth errors
-    hass.data[DOMAIN][entry.entry_id]["refresh_token"] = _try_refresh_token
+    # Register directly on this entry's coordinator for O(1) access on auth
+    # errors; the hass.data copy stays for the conversation retry path.
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    entry_data["refresh_token"] = _try_refresh_token
+    entry_data["coordinator"].set_refresh_token(_try_refresh_token)
 
 
 # ── Frontend registration ─────────────────────────────────────────────────────
@@ -490,6 +509,7 @@ def _async_register_services(hass: HomeAssistant) -> None:
             hass.bus.async_fire(
                 EVENT_MESSAGE_RECEIVED,
                 {
+                    ATTR_ENTRY_ID: entry_data.get("entry_id"),
                     ATTR_MESSAGE: assistant_message,
                     ATTR_SESSION_ID: session_id,
                     ATTR_MODEL: model_used,
@@ -504,6 +524,7 @@ def _async_register_services(hass: HomeAssistant) -> None:
             hass.bus.async_fire(
                 EVENT_MESSAGE_RECEIVED,
                 {
+                    ATTR_ENTRY_ID: entry_data.get("entry_id"),
                     ATTR_MESSAGE: f"OpenClaw error: {err}",
                     ATTR_SESSION_ID: session_id,
                     ATTR_MODEL: "unknown",
@@ -573,6 +594,7 @@ def _async_register_services(hass: HomeAssistant) -> None:
         )
 
         event_payload = {
+            ATTR_ENTRY_ID: entry_data.get("entry_id"),
             ATTR_TOOL: tool_name,
             ATTR_ACTION: action,
             ATTR_SESSION_KEY: session_key,
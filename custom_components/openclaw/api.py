@@ -14,6 +14,7 @@ from .const import (
     API_MODELS,
     API_TOOLS_INVOKE,
 )
+from .helpers import extract_text_recursive
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,9 +24,82 @@ API_TIMEOUT = aiohttp.ClientTimeout(total=10)
 # Timeout for streaming chat completions (long-running)
 STREAM_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_read=120)
 
+# Timeout for the per-cycle liveness probe — fail fast so a dead gateway
+# does not hold up the whole poll for the full API timeout.
+ALIVE_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# HTTP statuses that indicate a rejected/invalid token
+_AUTH_STATUSES = frozenset({401, 403})
+
+
+async def _read_error_body(resp: aiohttp.ClientResponse, limit: int = 512) -> str:
+    """Read at most ``limit`` bytes of a response body for an error message.
+
+    Error messages truncate the body anyway, so a capped read avoids
+    draining/decoding a potentially large HTML error page and releases the
+    connection back to the pool sooner.
+    """
+    return (await resp.content.read(limit)).decode("utf-8", errors="replace")
+
+
+def _retry_after_seconds(resp: aiohttp.ClientResponse) -> float | None:
+    """Parse a numeric Retry-After header, if the server sent one.
+
+    The HTTP-date form is rare on API endpoints and is ignored here.
+    """
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# Sentinel returned by _parse_sse_line for the "data: [DONE]" terminator.
+_SSE_DONE = object()
+
+
+def _parse_sse_line(line: bytes, debug_on: bool) -> Any:
+    """Parse one SSE line into delta content, ``_SSE_DONE``, or ``None``."""
+    decoded = line.decode("utf-8").strip()
+    if not decoded or not decoded.startswith("data: "):
+        return None
+
+    data_str = decoded[6:]  # strip "data: " prefix
+    if data_str == "[DONE]":
+        return _SSE_DONE
+
+    try:
+        chunk = json.loads(data_str)
+    except json.JSONDecodeError:
+        if debug_on:
+            _LOGGER.debug("Skipping non-JSON SSE line: %s", data_str[:100])
+        return None
+
+    choices = chunk.get("choices", [])
+    if choices:
+        return choices[0].get("delta", {}).get("content")
+    return None
+
 
 class OpenClawApiError(Exception):
-    """Base exception for OpenClaw API errors."""
+    """Base exception for OpenClaw API errors.
+
+    Carries the HTTP status (and a server-requested retry delay when one
+    was sent) so callers can react to rate limiting without string parsing.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 class OpenClawConnectionError(OpenClawApiError):
@@ -43,6 +117,18 @@ class OpenClawApiClient:
     Supports both regular JSON API calls and SSE streaming for chat completions.
     """
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_token",
+        "_use_ssl",
+        "_verify_ssl",
+        "_session",
+        "_agent_id",
+        "_base_url",
+        "_ssl_param",
+    )
+
     def __init__(
         self,
         host: str,
@@ -109,7 +195,11 @@ class OpenClawApiClient:
                     "Primary aiohttp session unavailable — creating fallback session. "
                     "This may bypass HA connection management"
                 )
-            self._session = aiohttp.ClientSession()
+            # Keep-alive connector so the per-cycle liveness probe and API
+            # calls reuse one TCP/TLS connection instead of re-handshaking.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=75)
+            )
         return self._session
 
     async def _request(
@@ -147,22 +237,21 @@ class OpenClawApiClient:
                 ssl=self._ssl_param,
                 **kwargs,
             ) as resp:
-                if resp.status == 401:
+                status = resp.status
+                if status in _AUTH_STATUSES:
                     raise OpenClawAuthError(
                         "Authentication failed — check gateway token"
                     )
-                if resp.status == 403:
-                    raise OpenClawAuthError(
-                        "Access forbidden — token may be invalid"
-                    )
-                if resp.status >= 400:
-                    text = await resp.text()
+                if status >= 400:
+                    text = await _read_error_body(resp)
                     raise OpenClawApiError(
-                        f"API error {resp.status}: {text[:200]}"
+                        f"API error {status}: {text[:200]}",
+                        status_code=status,
+                        retry_after=_retry_after_seconds(resp),
                     )
                 content_type = resp.content_type or ""
                 if "json" not in content_type:
-                    text = await resp.text()
+                    text = await _read_error_body(resp)
                     raise OpenClawApiError(
                         f"Unexpected response content type '{content_type}' (expected JSON). "
                         f"The host/port may be wrong or the gateway returned an error page. "
@@ -252,11 +341,16 @@ class OpenClawApiClient:
                 timeout=STREAM_TIMEOUT,
                 ssl=self._ssl_param,
             ) as resp:
-                if resp.status == 401:
+                status = resp.status
+                if status in _AUTH_STATUSES:
                     raise OpenClawAuthError("Authentication failed")
-                if resp.status >= 400:
-                    text = await resp.text()
-                    raise OpenClawApiError(f"Chat error {resp.status}: {text[:200]}")
+                if status >= 400:
+                    text = await _read_error_body(resp)
+                    raise OpenClawApiError(
+                        f"Chat error {status}: {text[:200]}",
+                        status_code=status,
+                        retry_after=_retry_after_seconds(resp),
+                    )
                 return await resp.json()
 
         except (aiohttp.ClientConnectorError, aiohttp.ClientOSError, asyncio.TimeoutError) as err:
@@ -264,6 +358,41 @@ class OpenClawApiClient:
                 f"Cannot connect to OpenClaw gateway: {err}"
             ) from err
 
+    async def async_send_message_text(
+        self,
+        message: str,
+        session_id: str | None = None,
+        model: str | None = None,
+        system_prompt: str | None = None,
+        agent_id: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> str:
+        """Send a chat message and return the assistant text.
+
+        Normalizes the response shape at the client boundary: the
+        OpenAI-compatible ``choices[0].message.content`` path is tried
+        directly first, with the generic recursive extractor as fallback
+        for providers that answer in other shapes. Returns an empty string
+        when no text can be found.
+        """
+        response = await self.async_send_message(
+            message=message,
+            session_id=session_id,
+            model=model,
+            system_prompt=system_prompt,
+            agent_id=agent_id,
+            extra_headers=extra_headers,
+        )
+        try:
+            content = response["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            content = None
+        if isinstance(content, str):
+            text = content.strip()
+            if text:
+                return text
+        return extract_text_recursive(response) or ""
+
     async def async_stream_message(
         self,
         message: str,
@@ -311,6 +440,9 @@ class OpenClawApiClient:
 
         session = await self._get_session()
         url = f"{self._base_url}{API_CHAT_COMPLETIONS}"
+        # Level check hoisted out of the SSE loop so disabled-debug runs skip
+        # the per-line slice/format work entirely.
+        debug_on = _LOGGER.isEnabledFor(logging.DEBUG)
 
         try:
             async with session.post(
@@ -320,32 +452,45 @@ class OpenClawApiClient:
                 timeout=STREAM_TIMEOUT,
                 ssl=self._ssl_param,
             ) as resp:
-                if resp.status == 401:
+                status = resp.status
+                if status in _AUTH_STATUSES:
                     raise OpenClawAuthError("Authentication failed")
-                if resp.status >= 400:
-                    text = await resp.text()
-                    raise OpenClawApiError(f"Chat error {resp.status}: {text[:200]}")
-
-                # Parse SSE stream
-                async for line in resp.content:
-                    decoded = line.decode("utf-8").strip()
-                    if not decoded or not decoded.startswith("data: "):
-                        continue
-
-                    data_str = decoded[6:]  # strip "data: " prefix
-                    if data_str == "[DONE]":
+                if status >= 400:
+                    text = await _read_error_body(resp)
+                    raise OpenClawApiError(
+                        f"Chat error {status}: {text[:200]}",
+                        status_code=status,
+                        retry_after=_retry_after_seconds(resp),
+                    )
+
+                # Parse SSE stream. iter_any() drains whatever the transport
+                # already buffered, so chatty token-per-event providers cost
+                # one loop iteration per network read instead of per line;
+                # lines are then split in bulk with a single C-level split.
+                pending = b""
+                done = False
+                async for raw in resp.content.iter_any():
+                    if pending:
+                        raw = pending + raw
+                    lines = raw.split(b"\n")
+                    pending = lines.pop()
+
+                    for line in lines:
+                        content = _parse_sse_line(line, debug_on)
+                        if content is _SSE_DONE:
+                            done = True
+                            break
+                        if content:
+                            yield content
+                    if done:
                         break
 
-                    try:
-                        chunk = json.loads(data_str)
-                        choices = chunk.get("choices", [])
-                        if choices:
-                            delta = choices[0].get("delta", {})
-                            content = delta.get("content")
-                            if content:
-                                yield content
-                    except json.JSONDecodeError:
-                        _LOGGER.debug("Skipping non-JSON SSE line: %s", data_str[:100])
+                if not done and pending:
+                    # readline()-style EOF behavior: a stream ending without
+                    # a trailing newline still delivers its last data line.
+                    content = _parse_sse_line(pending, debug_on)
+                    if content and content is not _SSE_DONE:
+                        yield content
 
         except (aiohttp.ClientConnectorError, aiohttp.ClientOSError, asyncio.TimeoutError) as err:
             raise OpenClawConnectionError(
@@ -385,14 +530,14 @@ class OpenClawApiClient:
                 timeout=API_TIMEOUT,
                 ssl=self._ssl_param,
             ) as resp:
-                if resp.status in (401, 403):
+                if resp.status in _AUTH_STATUSES:
                     raise OpenClawAuthError(
                         "Authentication failed — check gateway token"
                     )
 
                 content_type = resp.content_type or ""
                 if "json" not in content_type:
-                    text = await resp.text()
+                    text = await _read_error_body(resp)
                     raise OpenClawApiError(
                         f"Gateway returned '{content_type}' instead of JSON. "
                         "The OpenAI-compatible API is likely not enabled. "
@@ -412,9 +557,11 @@ class OpenClawApiClient:
     async def async_check_alive(self) -> bool:
         """Lightweight connectivity check — is the gateway process running?
 
-        Sends a GET to the base URL. The SPA catch-all returns 200 HTML for
-        any route, so any non-error HTTP response means the server is alive.
-        Auth is NOT verified here (the SPA ignores tokens).
+        Sends a HEAD to the base URL so no response body travels over the
+        wire; the SPA catch-all answers any route, so any non-error HTTP
+        response means the server is alive. Servers that reject HEAD with
+        405 fall back to a GET. Auth is NOT verified here (the SPA ignores
+        tokens).
 
         Returns:
             True if the gateway HTTP server is responding.
@@ -424,9 +571,16 @@ class OpenClawApiClient:
         """
         session = await self._get_session()
         try:
+            async with session.head(
+                self._base_url,
+                timeout=ALIVE_TIMEOUT,
+                ssl=self._ssl_param,
+            ) as resp:
+                if resp.status != 405:
+                    return resp.status < 500
             async with session.get(
                 self._base_url,
-                timeout=API_TIMEOUT,
+                timeout=ALIVE_TIMEOUT,
                 ssl=self._ssl_param,
             ) as resp:
                 return resp.status < 500
@@ -473,15 +627,20 @@ class OpenClawApiClient:
                 timeout=STREAM_TIMEOUT,
                 ssl=self._ssl_param,
             ) as resp:
-                if resp.status == 401:
+                status = resp.status
+                if status in _AUTH_STATUSES:
                     raise OpenClawAuthError("Authentication failed")
-                if resp.status >= 400:
-                    text = await resp.text()
-                    raise OpenClawApiError(f"Tool invoke error {resp.status}: {text[:300]}")
+                if status >= 400:
+                    text = await _read_error_body(resp)
+                    raise OpenClawApiError(
+                        f"Tool invoke error {status}: {text[:300]}",
+                        status_code=status,
+                        retry_after=_retry_after_seconds(resp),
+                    )
 
                 content_type = resp.content_type or ""
                 if "json" not in content_type:
-                    text = await resp.text()
+                    text = await _read_error_body(resp)
                     raise OpenClawApiError(
                         f"Unexpected tool response content type '{content_type}': {text[:300]}"
                     )
@@ -8,10 +8,11 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DATA_CONNECTED, DATA_GATEWAY_VERSION, DOMAIN
+from .const import DATA_CONNECTED, DOMAIN
 from .coordinator import OpenClawCoordinator
 
 
@@ -21,9 +22,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up OpenClaw binary sensors from a config entry."""
-    coordinator: OpenClawCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    entry_data: dict = hass.data[DOMAIN][entry.entry_id]
+    coordinator: OpenClawCoordinator = entry_data["coordinator"]
+    device_info: DeviceInfo = entry_data["device_info"]
 
-    async_add_entities([OpenClawConnectedSensor(coordinator, entry)])
+    async_add_entities([OpenClawConnectedSensor(coordinator, entry, device_info)])
 
 
 class OpenClawConnectedSensor(CoordinatorEntity[OpenClawCoordinator], BinarySensorEntity):
@@ -38,21 +41,15 @@ class OpenClawConnectedSensor(CoordinatorEntity[OpenClawCoordinator], BinarySens
         self,
         coordinator: OpenClawCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_connected"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "OpenClaw Assistant",
-            "manufacturer": "OpenClaw",
-            "model": "OpenClaw Gateway",
-            "sw_version": coordinator.data.get(DATA_GATEWAY_VERSION) if coordinator.data else None,
-        }
+        self._attr_device_info = device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return True if connected to the gateway."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+        data = self.coordinator.data
+        return bool(data) and data.get(DATA_CONNECTED, False)
@@ -13,6 +13,7 @@ import logging
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -53,12 +54,12 @@ async def async_setup_entry(
     entry_data: dict = hass.data[DOMAIN][entry.entry_id]
     coordinator: OpenClawCoordinator = entry_data["coordinator"]
     client: OpenClawApiClient = entry_data["client"]
+    device_info: DeviceInfo = entry_data["device_info"]
 
-    entities = [
-        OpenClawButton(coordinator, client, description, entry, hass)
+    async_add_entities(
+        OpenClawButton(coordinator, client, description, entry, hass, device_info)
         for description in BUTTON_DESCRIPTIONS
-    ]
-    async_add_entities(entities)
+    )
 
 
 class OpenClawButton(CoordinatorEntity[OpenClawCoordinator], ButtonEntity):
@@ -73,6 +74,7 @@ class OpenClawButton(CoordinatorEntity[OpenClawCoordinator], ButtonEntity):
         description: ButtonEntityDescription,
         entry: ConfigEntry,
         hass: HomeAssistant,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
@@ -80,36 +82,44 @@ class OpenClawButton(CoordinatorEntity[OpenClawCoordinator], ButtonEntity):
         self._client = client
         self._entry = entry
         self._hass = hass
+        self._store_key = f"{DOMAIN}_chat_history"
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "OpenClaw Assistant",
-            "manufacturer": "OpenClaw",
-            "model": "OpenClaw Gateway",
-        }
+        self._attr_device_info = device_info
 
     async def async_press(self) -> None:
-        """Handle button press."""
-        key = self.entity_description.key
-
-        if key == "clear_history":
-            store_key = f"{DOMAIN}_chat_history"
-            store = self._hass.data.get(store_key)
-            if isinstance(store, dict):
-                store.clear()
-            _LOGGER.info("OpenClaw chat history cleared via button")
-
-        elif key == "sync_history":
-            await self.coordinator.async_request_refresh()
-            _LOGGER.info("OpenClaw history sync triggered via button")
-
-        elif key == "run_diagnostics":
-            try:
-                alive = await self._client.async_check_alive()
-                if alive:
-                    _LOGGER.info("OpenClaw diagnostics: gateway is reachable")
-                else:
-                    _LOGGER.warning("OpenClaw diagnostics: gateway did not respond")
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.error("OpenClaw diagnostics failed: %s", err)
-            await self.coordinator.async_request_refresh()
+        """Handle button press by dispatching to the matching handler."""
+        handler = self._HANDLERS.get(self.entity_description.key)
+        if handler:
+            await handler(self)
+
+    async def _async_clear_history(self) -> None:
+        """Clear the in-memory chat history store."""
+        store = self._hass.data.get(self._store_key)
+        if isinstance(store, dict):
+            store.clear()
+        _LOGGER.info("OpenClaw chat history cleared via button")
+
+    async def _async_sync_history(self) -> None:
+        """Trigger a backend history re-sync via coordinator refresh."""
+        await self.coordinator.async_request_refresh()
+        _LOGGER.info("OpenClaw history sync triggered via button")
+
+    async def _async_run_diagnostics(self) -> None:
+        """Run a connectivity check against the gateway."""
+        try:
+            alive = await self._client.async_check_alive()
+            if alive:
+                _LOGGER.info("OpenClaw diagnostics: gateway is reachable")
+            else:
+                _LOGGER.warning("OpenClaw diagnostics: gateway did not respond")
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error("OpenClaw diagnostics failed: %s", err)
+        await self.coordinator.async_request_refresh()
+
+    # Key → handler dispatch; new buttons register here instead of
+    # growing an if/elif ladder in async_press.
+    _HANDLERS = {
+        "clear_history": _async_clear_history,
+        "sync_history": _async_sync_history,
+        "run_diagnostics": _async_run_diagnostics,
+    }
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -30,6 +31,12 @@ except ImportError:
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+try:
+    # orjson-backed, parses bytes directly without an intermediate decode
+    from homeassistant.util.json import json_loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 from .api import OpenClawApiClient, OpenClawApiError, OpenClawAuthError, OpenClawConnectionError
 from .const import (
     ADDON_CONFIGS_ROOT,
@@ -55,6 +62,7 @@ from .const import (
     CONF_VOICE_PROVIDER,
     CONF_THINKING_TIMEOUT,
     BROWSER_VOICE_LANGUAGES,
+    BROWSER_VOICE_LANGUAGES_SET,
     CONTEXT_STRATEGY_CLEAR,
     CONTEXT_STRATEGY_TRUNCATE,
     DEFAULT_AGENT_ID,
@@ -81,6 +89,12 @@ _LOGGER = logging.getLogger(__name__)
 
 # ── Filesystem helpers ────────────────────────────────────────────────────────
 
+# Precompiled match table for the discovery scan: str.endswith matches the
+# whole suffix tuple in one C call, and the frozenset covers exact names.
+_ADDON_SUFFIXES = tuple(f"_{fragment}" for fragment in ADDON_SLUG_FRAGMENTS)
+_ADDON_EXACT = frozenset(ADDON_SLUG_FRAGMENTS)
+
+
 def _find_addon_config_dir() -> Path | None:
     """Scan /addon_configs/ for the OpenClaw addon directory.
 
@@ -95,70 +109,73 @@ def _find_addon_config_dir() -> Path | None:
         Path to the addon config dir, or None if not found.
     """
     root = Path(ADDON_CONFIGS_ROOT)
-    if not root.is_dir():
-        return None
 
     # Exact slug match first (works if there's no hash prefix)
     exact = root / ADDON_SLUG
     if exact.is_dir():
         return exact
 
-    # Scan for <hash>_<fragment> pattern
+    # Scan for <hash>_<fragment> pattern. os.scandir reuses the d_type from
+    # the directory listing, so is_dir() avoids a stat() per entry. The scan
+    # stops at the first match — only one addon dir can exist, so there is
+    # nothing to gain from materialising and sorting the full listing.
     try:
-        for entry in sorted(root.iterdir()):
-            if not entry.is_dir():
-                continue
-            name = entry.name.lower()
-            for fragment in ADDON_SLUG_FRAGMENTS:
-                if name.endswith(f"_{fragment}") or name == fragment:
-                    _LOGGER.debug("Discovered addon config dir: %s", entry)
-                    return entry
+        with os.scandir(ADDON_CONFIGS_ROOT) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                name = entry.name.lower()
+                if name.endswith(_ADDON_SUFFIXES) or name in _ADDON_EXACT:
+                    _LOGGER.debug("Discovered addon config dir: %s", entry.path)
+                    return Path(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
     except PermissionError:
         _LOGGER.debug("No permission to scan %s", root)
 
     return None
 
 
-def _read_gateway_token_from_path(config_dir: Path) -> str | None:
-    """Read the gateway auth token from openclaw.json inside a config dir.
+def _read_openclaw_config(config_dir: Path) -> dict[str, Any] | None:
+    """Read and parse openclaw.json inside a config dir.
 
     Args:
         config_dir: The addon's mapped config directory.
 
     Returns:
-        Token string if found, else None.
+        Parsed config dict if found and valid, else None. Callers extract
+        both the token and the port from the same parse.
     """
     config_file = config_dir / OPENCLAW_CONFIG_REL_PATH
-    if not config_file.exists():
+    # EAFP: attempting the read saves the exists() stat on the happy path.
+    try:
+        raw = config_file.read_bytes()
+    except FileNotFoundError:
         _LOGGER.debug("openclaw.json not found at %s", config_file)
         return None
+    except OSError as err:
+        _LOGGER.debug("Error reading %s: %s", config_file, err)
+        return None
 
     try:
-        config = json.loads(config_file.read_text(encoding="utf-8"))
-        token = config.get("gateway", {}).get("auth", {}).get("token")
-        if token:
-            _LOGGER.debug("Found gateway token in %s", config_file)
-            return token
-        _LOGGER.debug("No gateway.auth.token in %s", config_file)
-    except (json.JSONDecodeError, IOError, KeyError) as err:
-        _LOGGER.debug("Error reading %s: %s", config_file, err)
+        return _json_loads(raw)
+    except (json.JSONDecodeError, ValueError) as err:
+        _LOGGER.debug("Error parsing %s: %s", config_file, err)
 
     return None
 
 
-def _read_gateway_port_from_path(config_dir: Path) -> int | None:
-    """Read the gateway port from openclaw.json.
+def _discover_addon_config() -> tuple[Path, dict[str, Any] | None] | None:
+    """Locate the addon config dir and parse its openclaw.json in one pass.
 
-    Useful as a fallback when the Supervisor API is not available.
+    Runs in the executor; bundling the directory scan and the file read
+    into one call keeps discovery at a single thread-pool round-trip and
+    parses openclaw.json exactly once per attempt.
     """
-    config_file = config_dir / OPENCLAW_CONFIG_REL_PATH
-    if not config_file.exists():
-        return None
-    try:
-        config = json.loads(config_file.read_text(encoding="utf-8"))
-        return config.get("gateway", {}).get("port")
-    except (json.JSONDecodeError, IOError):
+    config_dir = _find_addon_config_dir()
+    if config_dir is None:
         return None
+    return config_dir, _read_openclaw_config(config_dir)
 
 
 # ── Discovery helpers ─────────────────────────────────────────────────────────
@@ -218,29 +235,36 @@ async def _async_try_discover_addon(hass: HomeAssistant) -> dict[str, Any] | Non
             "Enable it in the addon configuration and restart the addon."
         )
 
-    # ── Step 2: Find the addon config directory on the filesystem ────
-    config_dir = await hass.async_add_executor_job(_find_addon_config_dir)
-    if not config_dir:
-        _LOGGER.debug("Could not find addon config directory under %s", ADDON_CONFIGS_ROOT)
-        return None
-
-    # ── Step 3: Read the gateway token ────────────────────────────────
-    token = await hass.async_add_executor_job(_read_gateway_token_from_path, config_dir)
-    if not token:
-        _LOGGER.info(
-            "Found addon config at %s but could not read gateway token. "
-            "Has the addon been started and onboarded?",
-            config_dir,
-        )
-        return None
+    # ── Step 2+3: Resolve the gateway token ───────────────────────────
+    # If Supervisor options already expose the token, skip the filesystem
+    # scan and file read entirely — no executor job needed.
+    config_dir: Path | None = None
+    gateway_config: dict[str, Any] = {}
+    token = addon_options.get("gateway_token")
+    if token:
+        _LOGGER.debug("Using gateway token from Supervisor addon options")
+    else:
+        discovered_config = await hass.async_add_executor_job(_discover_addon_config)
+        if not discovered_config:
+            _LOGGER.debug("Could not find addon config directory under %s", ADDON_CONFIGS_ROOT)
+            return None
+        config_dir, openclaw_config = discovered_config
+
+        gateway_config = (openclaw_config or {}).get("gateway", {})
+        token = gateway_config.get("auth", {}).get("token")
+        if not token:
+            _LOGGER.info(
+                "Found addon config at %s but could not read gateway token. "
+                "Has the addon been started and onboarded?",
+                config_dir,
+            )
+            return None
 
     # ── Build discovered config ───────────────────────────────────────
     # Prefer Supervisor-reported port, fall back to openclaw.json, then default
     port = addon_options.get("gateway_port")
     if port is None:
-        port = await hass.async_add_executor_job(
-            _read_gateway_port_from_path, config_dir
-        )
+        port = gateway_config.get("port")
     if port is None:
         port = DEFAULT_GATEWAY_PORT
 
@@ -268,7 +292,7 @@ async def _async_try_discover_addon(hass: HomeAssistant) -> dict[str, Any] | Non
         CONF_GATEWAY_TOKEN: token,
         CONF_USE_SSL: use_ssl,
         CONF_VERIFY_SSL: verify_ssl,
-        CONF_ADDON_CONFIG_PATH: str(config_dir),
+        CONF_ADDON_CONFIG_PATH: str(config_dir) if config_dir else None,
     }
 
 
@@ -279,22 +303,51 @@ async def _async_validate_connection(
     token: str,
     use_ssl: bool = False,
     verify_ssl: bool = True,
+    client_cache: dict[tuple[str, int, bool, bool], OpenClawApiClient] | None = None,
 ) -> bool:
-    """Validate that we can connect and authenticate to the gateway."""
-    session = async_get_clientsession(hass, verify_ssl=verify_ssl)
-    client = OpenClawApiClient(
-        host=host,
-        port=port,
-        token=token,
-        use_ssl=use_ssl,
-        verify_ssl=verify_ssl,
-        session=session,
-    )
+    """Validate that we can connect and authenticate to the gateway.
+
+    When ``client_cache`` is given (the config flow passes its own dict),
+    probe clients are reused across validation retries so the underlying
+    aiohttp session keeps its connection alive between attempts.
+    """
+    cache_key = (host, port, use_ssl, verify_ssl)
+    client = client_cache.get(cache_key) if client_cache is not None else None
+    if client is not None:
+        client.update_token(token)
+    else:
+        session = async_get_clientsession(hass, verify_ssl=verify_ssl)
+        client = OpenClawApiClient(
+            host=host,
+            port=port,
+            token=token,
+            use_ssl=use_ssl,
+            verify_ssl=verify_ssl,
+            session=session,
+        )
+        if client_cache is not None:
+            client_cache[cache_key] = client
     return await client.async_check_connection()
 
 
 # ── Config flow ───────────────────────────────────────────────────────────────
 
+# Built once at import time — the manual form is re-shown on every
+# validation retry and the schema never varies.
+_MANUAL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_GATEWAY_HOST, default=DEFAULT_GATEWAY_HOST): str,
+        vol.Required(CONF_GATEWAY_PORT, default=DEFAULT_GATEWAY_PORT): vol.All(
+            int, vol.Range(min=1, max=65535)
+        ),
+        vol.Required(CONF_GATEWAY_TOKEN): str,
+        vol.Optional(CONF_USE_SSL, default=False): bool,
+        vol.Optional(CONF_VERIFY_SSL, default=True): bool,
+        vol.Optional(CONF_AGENT_ID, default=DEFAULT_AGENT_ID): str,
+    }
+)
+
+
 class OpenClawConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OpenClaw."""
 
@@ -308,6 +361,7 @@ class OpenClawConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered: dict[str, Any] | None = None
+        self._probe_clients: dict[tuple[str, int, bool, bool], OpenClawApiClient] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -345,6 +399,7 @@ class OpenClawConfigFlow(ConfigFlow, domain=DOMAIN):
                     self._discovered[CONF_GATEWAY_TOKEN],
                     self._discovered.get(CONF_USE_SSL, False),
                     self._discovered.get(CONF_VERIFY_SSL, True),
+                    client_cache=self._probe_clients,
                 )
             except OpenClawAuthError:
                 connected = False
@@ -392,7 +447,13 @@ class OpenClawConfigFlow(ConfigFlow, domain=DOMAIN):
 
             try:
                 connected = await _async_validate_connection(
-                    self.hass, host, port, token, use_ssl, verify_ssl
+                    self.hass,
+                    host,
+                    port,
+                    token,
+                    use_ssl,
+                    verify_ssl,
+                    client_cache=self._probe_clients,
                 )
             except OpenClawAuthError:
                 errors["base"] = "invalid_auth"
@@ -427,20 +488,7 @@ class OpenClawConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_GATEWAY_HOST, default=DEFAULT_GATEWAY_HOST
-                    ): str,
-                    vol.Required(
-                        CONF_GATEWAY_PORT, default=DEFAULT_GATEWAY_PORT
-                    ): vol.All(int, vol.Range(min=1, max=65535)),
-                    vol.Required(CONF_GATEWAY_TOKEN): str,
-                    vol.Optional(CONF_USE_SSL, default=False): bool,
-                    vol.Optional(CONF_VERIFY_SSL, default=True): bool,
-                    vol.Optional(CONF_AGENT_ID, default=DEFAULT_AGENT_ID): str,
-                }
-            ),
+            data_schema=_MANUAL_SCHEMA,
             errors=errors,
         )
 
@@ -547,13 +595,16 @@ class OpenClawOptionsFlow(OptionsFlowWithReload):
         }
 
         if selected_provider == "browser":
+            current_language = options.get(
+                CONF_BROWSER_VOICE_LANGUAGE,
+                DEFAULT_BROWSER_VOICE_LANGUAGE,
+            )
+            if current_language not in BROWSER_VOICE_LANGUAGES_SET:
+                current_language = DEFAULT_BROWSER_VOICE_LANGUAGE
             schema[
                 vol.Optional(
                     CONF_BROWSER_VOICE_LANGUAGE,
-                    default=options.get(
-                        CONF_BROWSER_VOICE_LANGUAGE,
-                        DEFAULT_BROWSER_VOICE_LANGUAGE,
-                    ),
+                    default=current_language,
                 )
             ] = vol.In(BROWSER_VOICE_LANGUAGES)
 
@@ -1,59 +1,62 @@
 """Constants for the OpenClaw integration."""
 
-DOMAIN = "openclaw"
+import sys
+from typing import Final
+
+DOMAIN: Final = "openclaw"
 
 # Addon
-ADDON_SLUG = "openclaw_assistant_dev"
+ADDON_SLUG: Final = "openclaw_assistant_dev"
 # The Supervisor prefixes a repo hash to the slug in the filesystem path
 #   e.g. /addon_configs/0bfc167e_openclaw_assistant
 # We cannot hardcode this — it must be discovered at runtime.
-ADDON_CONFIGS_ROOT = "/addon_configs"
-ADDON_SLUG_FRAGMENTS = ("openclaw_assistant", "openclaw")
-OPENCLAW_CONFIG_REL_PATH = ".openclaw/openclaw.json"
+ADDON_CONFIGS_ROOT: Final = "/addon_configs"
+ADDON_SLUG_FRAGMENTS: Final = ("openclaw_assistant", "openclaw")
+OPENCLAW_CONFIG_REL_PATH: Final = ".openclaw/openclaw.json"
 
 # Defaults
-DEFAULT_GATEWAY_HOST = "127.0.0.1"
-DEFAULT_GATEWAY_PORT = 18789
-DEFAULT_SCAN_INTERVAL = 30  # seconds
+DEFAULT_GATEWAY_HOST: Final = "127.0.0.1"
+DEFAULT_GATEWAY_PORT: Final = 18789
+DEFAULT_SCAN_INTERVAL: Final = 30  # seconds
 
 # Config entry keys
-CONF_GATEWAY_HOST = "gateway_host"
-CONF_GATEWAY_PORT = "gateway_port"
-CONF_GATEWAY_TOKEN = "gateway_token"
-CONF_USE_SSL = "use_ssl"
-CONF_VERIFY_SSL = "verify_ssl"
-CONF_ADDON_CONFIG_PATH = "addon_config_path"
-CONF_AGENT_ID = "agent_id"
-CONF_VOICE_AGENT_ID = "voice_agent_id"
-CONF_ASSIST_SESSION_ID = "assist_session_id"
+CONF_GATEWAY_HOST: Final = "gateway_host"
+CONF_GATEWAY_PORT: Final = "gateway_port"
+CONF_GATEWAY_TOKEN: Final = "gateway_token"
+CONF_USE_SSL: Final = "use_ssl"
+CONF_VERIFY_SSL: Final = "verify_ssl"
+CONF_ADDON_CONFIG_PATH: Final = "addon_config_path"
+CONF_AGENT_ID: Final = "agent_id"
+CONF_VOICE_AGENT_ID: Final = "voice_agent_id"
+CONF_ASSIST_SESSION_ID: Final = "assist_session_id"
 
 # Options
-CONF_INCLUDE_EXPOSED_CONTEXT = "include_exposed_context"
-CONF_CONTEXT_MAX_CHARS = "context_max_chars"
-CONF_CONTEXT_STRATEGY = "context_strategy"
-CONF_ENABLE_TOOL_CALLS = "enable_tool_calls"
-CONF_WAKE_WORD_ENABLED = "wake_word_enabled"
-CONF_WAKE_WORD = "wake_word"
-CONF_ALLOW_BRAVE_WEBSPEECH = "allow_brave_webspeech"
-CONF_VOICE_PROVIDER = "voice_provider"
-CONF_BROWSER_VOICE_LANGUAGE = "browser_voice_language"
-CONF_THINKING_TIMEOUT = "thinking_timeout"
-
-DEFAULT_AGENT_ID = "main"
-DEFAULT_VOICE_AGENT_ID = ""
-DEFAULT_ASSIST_SESSION_ID = ""
-DEFAULT_INCLUDE_EXPOSED_CONTEXT = True
-DEFAULT_CONTEXT_MAX_CHARS = 13000
-DEFAULT_CONTEXT_STRATEGY = "truncate"
-DEFAULT_ENABLE_TOOL_CALLS = False
-DEFAULT_WAKE_WORD_ENABLED = False
-DEFAULT_WAKE_WORD = "hey openclaw"
-DEFAULT_ALLOW_BRAVE_WEBSPEECH = False
-DEFAULT_VOICE_PROVIDER = "browser"
-DEFAULT_BROWSER_VOICE_LANGUAGE = "auto"
-DEFAULT_THINKING_TIMEOUT = 120
-
-BROWSER_VOICE_LANGUAGES: tuple[str, ...] = (
+CONF_INCLUDE_EXPOSED_CONTEXT: Final = "include_exposed_context"
+CONF_CONTEXT_MAX_CHARS: Final = "context_max_chars"
+CONF_CONTEXT_STRATEGY: Final = "context_strategy"
+CONF_ENABLE_TOOL_CALLS: Final = "enable_tool_calls"
+CONF_WAKE_WORD_ENABLED: Final = "wake_word_enabled"
+CONF_WAKE_WORD: Final = "wake_word"
+CONF_ALLOW_BRAVE_WEBSPEECH: Final = "allow_brave_webspeech"
+CONF_VOICE_PROVIDER: Final = "voice_provider"
+CONF_BROWSER_VOICE_LANGUAGE: Final = "browser_voice_language"
+CONF_THINKING_TIMEOUT: Final = "thinking_timeout"
+
+DEFAULT_AGENT_ID: Final = "main"
+DEFAULT_VOICE_AGENT_ID: Final = ""
+DEFAULT_ASSIST_SESSION_ID: Final = ""
+DEFAULT_INCLUDE_EXPOSED_CONTEXT: Final = True
+DEFAULT_CONTEXT_MAX_CHARS: Final = 13000
+DEFAULT_CONTEXT_STRATEGY: Final = "truncate"
+DEFAULT_ENABLE_TOOL_CALLS: Final = False
+DEFAULT_WAKE_WORD_ENABLED: Final = False
+DEFAULT_WAKE_WORD: Final = "hey openclaw"
+DEFAULT_ALLOW_BRAVE_WEBSPEECH: Final = False
+DEFAULT_VOICE_PROVIDER: Final = "browser"
+DEFAULT_BROWSER_VOICE_LANGUAGE: Final = "auto"
+DEFAULT_THINKING_TIMEOUT: Final = 120
+
+BROWSER_VOICE_LANGUAGES: Final[tuple[str, ...]] = (
 	"auto",
 	"bg-BG",
 	"en-US",
@@ -90,63 +93,76 @@ BROWSER_VOICE_LANGUAGES: tuple[str, ...] = (
 	"hi-IN",
 )
 
-CONTEXT_STRATEGY_TRUNCATE = "truncate"
-CONTEXT_STRATEGY_CLEAR = "clear"
+# O(1) membership checks; the tuple above keeps the ordered UI rendering.
+BROWSER_VOICE_LANGUAGES_SET: Final[frozenset[str]] = frozenset(BROWSER_VOICE_LANGUAGES)
+
+CONTEXT_STRATEGY_TRUNCATE: Final = "truncate"
+CONTEXT_STRATEGY_CLEAR: Final = "clear"
 
 # Coordinator data keys
-DATA_STATUS = "status"
-DATA_MODEL = "model"
-DATA_SESSION_COUNT = "session_count"
-DATA_SESSIONS = "sessions"
-DATA_LAST_ACTIVITY = "last_activity"
-DATA_CONNECTED = "connected"
-DATA_GATEWAY_VERSION = "gateway_version"
-DATA_UPTIME = "uptime"
-DATA_PROVIDER = "provider"
-DATA_CONTEXT_WINDOW = "context_window"
-DATA_LAST_TOOL_NAME = "last_tool_name"
-DATA_LAST_TOOL_STATUS = "last_tool_status"
-DATA_LAST_TOOL_DURATION_MS = "last_tool_duration_ms"
-DATA_LAST_TOOL_INVOKED_AT = "last_tool_invoked_at"
-DATA_LAST_TOOL_ERROR = "last_tool_error"
-DATA_LAST_TOOL_RESULT_PREVIEW = "last_tool_result_preview"
+DATA_STATUS: Final = "status"
+DATA_MODEL: Final = "model"
+DATA_SESSION_COUNT: Final = "session_count"
+DATA_SESSIONS: Final = "sessions"
+DATA_LAST_ACTIVITY: Final = "last_activity"
+DATA_CONNECTED: Final = "connected"
+DATA_GATEWAY_VERSION: Final = "gateway_version"
+DATA_UPTIME: Final = "uptime"
+DATA_PROVIDER: Final = "provider"
+DATA_CONTEXT_WINDOW: Final = "context_window"
+DATA_LAST_TOOL_NAME: Final = "last_tool_name"
+DATA_LAST_TOOL_STATUS: Final = "last_tool_status"
+DATA_LAST_TOOL_DURATION_MS: Final = "last_tool_duration_ms"
+DATA_LAST_TOOL_INVOKED_AT: Final = "last_tool_invoked_at"
+DATA_LAST_TOOL_ERROR: Final = "last_tool_error"
+DATA_LAST_TOOL_RESULT_PREVIEW: Final = "last_tool_result_preview"
 
 # Platforms
-PLATFORMS = ["sensor", "binary_sensor", "conversation", "event", "button", "select"]
+PLATFORMS: Final[tuple[str, ...]] = (
+    "sensor",
+    "binary_sensor",
+    "conversation",
+    "event",
+    "button",
+    "select",
+)
 
 # Events
-EVENT_MESSAGE_RECEIVED = f"{DOMAIN}_message_received"
-EVENT_TOOL_INVOKED = f"{DOMAIN}_tool_invoked"
+# Interned because f-string-built keys are not auto-interned by CPython and
+# these are used as dict/bus-event keys on hot paths.
+EVENT_MESSAGE_RECEIVED: Final = sys.intern(f"{DOMAIN}_message_received")
+EVENT_TOOL_INVOKED: Final = sys.intern(f"{DOMAIN}_tool_invoked")
 
 # Services
-SERVICE_SEND_MESSAGE = "send_message"
-SERVICE_CLEAR_HISTORY = "clear_history"
-SERVICE_INVOKE_TOOL = "invoke_tool"
+SERVICE_SEND_MESSAGE: Final = "send_message"
+SERVICE_CLEAR_HISTORY: Final = "clear_history"
+SERVICE_INVOKE_TOOL: Final = "invoke_tool"
 
 # Attributes
-ATTR_MESSAGE = "message"
-ATTR_SOURCE = "source"
-ATTR_SESSION_ID = "session_id"
-ATTR_ATTACHMENTS = "attachments"
-ATTR_MODEL = "model"
-ATTR_TIMESTAMP = "timestamp"
-ATTR_TOOL = "tool"
-ATTR_ACTION = "action"
-ATTR_ARGS = "args"
-ATTR_SESSION_KEY = "session_key"
-ATTR_DRY_RUN = "dry_run"
-ATTR_MESSAGE_CHANNEL = "message_channel"
-ATTR_ACCOUNT_ID = "account_id"
-ATTR_AGENT_ID = "agent_id"
-ATTR_OK = "ok"
-ATTR_RESULT = "result"
-ATTR_ERROR = "error"
-ATTR_DURATION_MS = "duration_ms"
+ATTR_ENTRY_ID: Final = "entry_id"
+ATTR_MESSAGE: Final = "message"
+ATTR_SOURCE: Final = "source"
+ATTR_SESSION_ID: Final = "session_id"
+ATTR_ATTACHMENTS: Final = "attachments"
+ATTR_MODEL: Final = "model"
+ATTR_TIMESTAMP: Final = "timestamp"
+ATTR_TOOL: Final = "tool"
+ATTR_ACTION: Final = "action"
+ATTR_ARGS: Final = "args"
+ATTR_SESSION_KEY: Final = "session_key"
+ATTR_DRY_RUN: Final = "dry_run"
+ATTR_MESSAGE_CHANNEL: Final = "message_channel"
+ATTR_ACCOUNT_ID: Final = "account_id"
+ATTR_AGENT_ID: Final = "agent_id"
+ATTR_OK: Final = "ok"
+ATTR_RESULT: Final = "result"
+ATTR_ERROR: Final = "error"
+ATTR_DURATION_MS: Final = "duration_ms"
 
 # API endpoints
 # The OpenClaw gateway exposes only the OpenAI-compatible endpoints.
 # /api/status and /api/sessions do not exist — the gateway returns its SPA
 # home page (text/html) for any unrecognised route.
-API_MODELS = "/v1/models"
-API_CHAT_COMPLETIONS = "/v1/chat/completions"
-API_TOOLS_INVOKE = "/tools/invoke"
+API_MODELS: Final = "/v1/models"
+API_CHAT_COMPLETIONS: Final = "/v1/chat/completions"
+API_TOOLS_INVOKE: Final = "/tools/invoke"
@@ -6,10 +6,12 @@ with Assist, Voice PE, and any HA voice satellite.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from collections.abc import Mapping
 import logging
 import re
-from typing import Any
+import time
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from homeassistant.components import conversation
 from homeassistant.config_entries import ConfigEntry
@@ -19,6 +21,7 @@ from homeassistant.helpers import intent
 
 from .api import OpenClawApiClient, OpenClawApiError
 from .const import (
+    ATTR_ENTRY_ID,
     ATTR_MESSAGE,
     ATTR_MODEL,
     ATTR_SESSION_ID,
@@ -40,7 +43,7 @@ from .const import (
 )
 from .coordinator import OpenClawCoordinator
 from .exposure import apply_context_policy, build_exposed_entities_context
-from .helpers import extract_text_recursive
+from .helpers import utcnow_isoformat
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +60,12 @@ def _scrub_tool_code_fences(text: str) -> str:
     scrubbed = _TOOL_CODE_FENCE_RE.sub("", text).strip()
     return scrubbed if scrubbed else "OK."
 
+# The context block embeds live entity states, so it may only be reused
+# for turns arriving essentially together (e.g. a command and an immediate
+# follow-up question must not see a pre-command snapshot). Keep this well
+# under the time a user takes to phrase the next turn.
+_CONTEXT_CACHE_TTL = 2.0
+
 _VOICE_REQUEST_HEADERS = {
     "x-openclaw-source": "voice",
     "x-ha-voice": "true",
@@ -90,24 +99,93 @@ class OpenClawConversationAgent(conversation.AbstractConversationAgent):
     allowing use with Voice PE, satellites, and the built-in HA Assist dialog.
     """
 
+    # Shared read-only attribution dict; the property previously allocated a
+    # fresh dict on every access.
+    _ATTRIBUTION: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {"name": "Powered by OpenClaw", "url": "https://openclaw.dev"}
+    )
+
+    # OpenClaw handles language via its configured model, so we declare
+    # support for all languages and let the model handle translation. A
+    # plain class attribute skips the descriptor call a property would pay.
+    supported_languages = conversation.MATCH_ALL
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the conversation agent."""
         self.hass = hass
         self.entry = entry
+        # Lazily cached hass.data lookup and options-derived values; every
+        # turn otherwise re-walks hass.data and re-reads entry.options.
+        self._entry_data: dict[str, Any] | None = None
+        self._options_cache: dict[str, Any] | None = None
+        # (expires_at, max_chars, strategy, context) for the last built
+        # exposed-entities context.
+        self._context_cache: tuple[float, int, str, str | None] | None = None
+        # Moving average of whether streaming actually produced content;
+        # providers that never stream get routed straight to the
+        # non-streaming call instead of paying a wasted request per turn.
+        self._stream_ok_ema = 1.0
+        self._stream_attempts = 0
+        # Memoized "not configured" results keyed by language — during a
+        # misconfiguration/restart storm this error repeats every turn.
+        self._not_configured_results: dict[str, conversation.ConversationResult] = {}
+        entry.async_on_unload(entry.add_update_listener(self._async_entry_updated))
+
+    async def _async_entry_updated(
+        self, hass: HomeAssistant, entry: ConfigEntry
+    ) -> None:
+        """Drop cached option values when the entry is updated."""
+        self._options_cache = None
+        self._context_cache = None
+
+    def _get_entry_data(self) -> dict[str, Any] | None:
+        """Return the entry's runtime data, caching the hass.data lookup."""
+        entry_data = self._entry_data
+        if entry_data is None:
+            entry_data = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id)
+            self._entry_data = entry_data
+        return entry_data
+
+    def _get_options(self) -> dict[str, Any]:
+        """Return options-derived values, recomputed only after updates."""
+        cached = self._options_cache
+        if cached is not None:
+            return cached
 
-    @property
-    def attribution(self) -> dict[str, str]:
-        """Return attribution info."""
-        return {"name": "Powered by OpenClaw", "url": "https://openclaw.dev"}
+        options = self.entry.options
+        voice_agent_id = self._normalize_optional_text(
+            options.get(CONF_VOICE_AGENT_ID)
+        )
+        configured_agent_id = self._normalize_optional_text(
+            options.get(
+                CONF_AGENT_ID,
+                self.entry.data.get(CONF_AGENT_ID, DEFAULT_AGENT_ID),
+            )
+        )
+        cached = {
+            "agent_id": voice_agent_id or configured_agent_id,
+            "session_id": self._normalize_optional_text(
+                options.get(CONF_ASSIST_SESSION_ID, DEFAULT_ASSIST_SESSION_ID)
+            ),
+            "active_model": self._normalize_optional_text(
+                options.get("active_model")
+            ),
+            "include_context": options.get(
+                CONF_INCLUDE_EXPOSED_CONTEXT,
+                DEFAULT_INCLUDE_EXPOSED_CONTEXT,
+            ),
+            "max_chars": int(
+                options.get(CONF_CONTEXT_MAX_CHARS, DEFAULT_CONTEXT_MAX_CHARS)
+            ),
+            "strategy": options.get(CONF_CONTEXT_STRATEGY, DEFAULT_CONTEXT_STRATEGY),
+        }
+        self._options_cache = cached
+        return cached
 
     @property
-    def supported_languages(self) -> list[str] | str:
-        """Return supported languages.
-
-        OpenClaw handles language via its configured model, so we declare
-        support for all languages and let the model handle translation.
-        """
-        return conversation.MATCH_ALL
+    def attribution(self) -> Mapping[str, str]:
+        """Return attribution info."""
+        return self._ATTRIBUTION
 
     async def async_process(
         self, user_input: conversation.ConversationInput
@@ -123,50 +201,46 @@ class OpenClawConversationAgent(conversation.AbstractConversationAgent):
         Returns:
             ConversationResult with the assistant's response.
         """
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id)
+        entry_data = self._get_entry_data()
         if not entry_data:
-            return self._error_result(
-                user_input, "OpenClaw integration not configured"
-            )
+            # Only cacheable without a conversation id; the result embeds it.
+            if user_input.conversation_id:
+                return self._error_result(
+                    user_input, "OpenClaw integration not configured"
+                )
+            result = self._not_configured_results.get(user_input.language)
+            if result is None:
+                result = self._error_result(
+                    user_input, "OpenClaw integration not configured"
+                )
+                self._not_configured_results[user_input.language] = result
+            return result
 
         client: OpenClawApiClient = entry_data["client"]
         coordinator: OpenClawCoordinator = entry_data["coordinator"]
 
         message = user_input.text
         assistant_id = "conversation"
-        options = self.entry.options
-        voice_agent_id = self._normalize_optional_text(
-            options.get(CONF_VOICE_AGENT_ID)
-        )
-        configured_agent_id = self._normalize_optional_text(
-            options.get(
-                CONF_AGENT_ID,
-                self.entry.data.get(CONF_AGENT_ID, DEFAULT_AGENT_ID),
-            )
-        )
-        resolved_agent_id = voice_agent_id or configured_agent_id
+        options = self._get_options()
+        resolved_agent_id = options["agent_id"]
         conversation_id = self._resolve_conversation_id(user_input, resolved_agent_id)
-        active_model = self._normalize_optional_text(options.get("active_model"))
-        include_context = options.get(
-            CONF_INCLUDE_EXPOSED_CONTEXT,
-            DEFAULT_INCLUDE_EXPOSED_CONTEXT,
-        )
-        max_chars = int(options.get(CONF_CONTEXT_MAX_CHARS, DEFAULT_CONTEXT_MAX_CHARS))
-        strategy = options.get(CONF_CONTEXT_STRATEGY, DEFAULT_CONTEXT_STRATEGY)
+        active_model = options["active_model"]
+        include_context = options["include_context"]
+        max_chars = options["max_chars"]
+        strategy = options["strategy"]
 
-        raw_context = (
-            build_exposed_entities_context(
-                self.hass,
-                assistant=assistant_id,
-            )
+        exposed_context = (
+            self._get_exposed_context(assistant_id, max_chars, strategy)
             if include_context
             else None
         )
-        exposed_context = apply_context_policy(raw_context, max_chars, strategy)
         extra_system_prompt = getattr(user_input, "extra_system_prompt", None)
-        system_prompt = "\n\n".join(
-            part for part in (exposed_context, extra_system_prompt) if part
-        ) or None
+        # Explicit branches: having both parts is rare, so the common case
+        # passes one string through without a generator + join.
+        if exposed_context and extra_system_prompt:
+            system_prompt = exposed_context + "\n\n" + extra_system_prompt
+        else:
+            system_prompt = exposed_context or extra_system_prompt or None
 
         try:
             full_response = await self._get_response(
@@ -210,17 +284,24 @@ class OpenClawConversationAgent(conversation.AbstractConversationAgent):
                     f"Error communicating with OpenClaw: {err}",
                 )
 
-        # Fire event so automations can react to the response
-        self.hass.bus.async_fire(
-            EVENT_MESSAGE_RECEIVED,
-            {
-                ATTR_MESSAGE: full_response,
-                ATTR_SESSION_ID: conversation_id,
-                ATTR_MODEL: coordinator.data.get(DATA_MODEL) if coordinator.data else None,
-                ATTR_TIMESTAMP: datetime.now(timezone.utc).isoformat(),
-            },
-        )
+        # Fire event so automations can react to the response. Skip building
+        # the payload entirely when nothing subscribes to the event.
+        if self.hass.bus.async_listeners().get(EVENT_MESSAGE_RECEIVED, 0) > 0:
+            coordinator_data = coordinator.data
+            self.hass.bus.async_fire(
+                EVENT_MESSAGE_RECEIVED,
+                {
+                    ATTR_ENTRY_ID: self.entry.entry_id,
+                    ATTR_MESSAGE: full_response,
+                    ATTR_SESSION_ID: conversation_id,
+                    ATTR_MODEL: (
+                        coordinator_data.get(DATA_MODEL) if coordinator_data else None
+                    ),
+                    ATTR_TIMESTAMP: utcnow_isoformat(),
+                },
+            )
         coordinator.update_last_activity()
+        coordinator.record_session_activity(conversation_id)
 
         intent_response = intent.IntentResponse(language=user_input.language)
         intent_response.async_set_speech(full_response)
@@ -231,18 +312,46 @@ class OpenClawConversationAgent(conversation.AbstractConversationAgent):
             continue_conversation=self._should_continue(full_response),
         )
 
+    def _get_exposed_context(
+        self,
+        assistant_id: str,
+        max_chars: int,
+        strategy: str,
+    ) -> str | None:
+        """Return the exposed-entities context, rebuilt at most per TTL.
+
+        The exposure scan walks every state in the state machine and is the
+        dominant CPU cost of a turn outside the network call. The TTL is
+        deliberately short: the block carries entity states, and a turn that
+        reacts to the previous one must see their current values.
+        """
+        now = time.monotonic()
+        cached = self._context_cache
+        if (
+            cached is not None
+            and cached[0] > now
+            and cached[1] == max_chars
+            and cached[2] == strategy
+        ):
+            return cached[3]
+
+        raw_context = build_exposed_entities_context(self.hass, assistant=assistant_id)
+        exposed_context = apply_context_policy(raw_context, max_chars, strategy)
+        self._context_cache = (
+            now + _CONTEXT_CACHE_TTL,
+            max_chars,
+            strategy,
+            exposed_context,
+        )
+        return exposed_context
+
     def _resolve_conversation_id(
         self,
         user_input: conversation.ConversationInput,
         agent_id: str | None,
     ) -> str:
         """Return conversation id from HA with conservative agent namespacing."""
-        configured_session_id = self._normalize_optional_text(
-            self.entry.options.get(
-                CONF_ASSIST_SESSION_ID,
-                DEFAULT_ASSIST_SESSION_ID,
-            )
-        )
+        configured_session_id = self._get_options()["session_id"]
         if configured_session_id:
             return configured_session_id
 
@@ -282,22 +391,48 @@ class OpenClawConversationAgent(conversation.AbstractConversationAgent):
         system_prompt: str | None = None,
         model: str | None = None,
     ) -> str:
-        """Get a response from OpenClaw, trying streaming first."""
-        full_response = ""
-        async for chunk in client.async_stream_message(
-            message=message,
-            session_id=conversation_id,
-            model=model,
-            system_prompt=system_prompt,
-            agent_id=agent_id,
-            extra_headers=_VOICE_REQUEST_HEADERS,
-        ):
-            full_response += chunk
+        """Get a response from OpenClaw, trying streaming first.
 
-        if full_response:
-            return _scrub_tool_code_fences(full_response)
+        When streaming has consistently yielded nothing (the moving average
+        drops below 5%), the wasted streaming request is skipped and the
+        non-streaming call is made directly; every 50th turn re-probes the
+        stream so recovery is detected.
+        """
+        self._stream_attempts += 1
+        if self._stream_ok_ema >= 0.05 or self._stream_attempts % 50 == 0:
+            # Collect chunks and join once — appending to a str copies the
+            # whole accumulated response on every SSE delta (O(n²) on long
+            # answers). The client yields str, but a bytes-yielding stream
+            # (SSE transports differ) gets a bytearray sink and one decode.
+            parts: list[str] = []
+            byte_buf: bytearray | None = None
+            async for chunk in client.async_stream_message(
+                message=message,
+                session_id=conversation_id,
+                model=model,
+                system_prompt=system_prompt,
+                agent_id=agent_id,
+                extra_headers=_VOICE_REQUEST_HEADERS,
+            ):
+                if not chunk:
+                    continue
+                if type(chunk) is bytes:
+                    if byte_buf is None:
+                        byte_buf = bytearray()
+                    byte_buf += chunk
+                else:
+                    parts.append(chunk)
+
+            if byte_buf is not None:
+                parts.append(byte_buf.decode("utf-8", errors="replace"))
+            full_response = "".join(parts)
+            self._stream_ok_ema = 0.9 * self._stream_ok_ema + (
+                0.1 if full_response else 0.0
+            )
+            if full_response:
+                return _scrub_tool_code_fences(full_response)
 
-        response = await client.async_send_message(
+        text = await client.async_send_message_text(
             message=message,
             session_id=conversation_id,
             model=model,
@@ -305,7 +440,7 @@ class OpenClawConversationAgent(conversation.AbstractConversationAgent):
             agent_id=agent_id,
             extra_headers=_VOICE_REQUEST_HEADERS,
         )
-        return _scrub_tool_code_fences(extract_text_recursive(response) or "")
+        return _scrub_tool_code_fences(text)
 
     @staticmethod
     def _should_continue(response: str) -> bool:
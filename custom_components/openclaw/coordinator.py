@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
 import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
@@ -38,6 +41,38 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+_DEFAULT_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+# Cap the backed-off poll interval at ten minutes.
+_MAX_BACKOFF_SECONDS = 600
+# Minimum cooldown applied when the gateway answers 429, and the number of
+# clean cycles required before the base interval is restored afterwards.
+_RATE_LIMIT_MIN_COOLDOWN = 60.0
+_RATE_LIMIT_OK_CYCLES = 3
+# With no chat activity for this long, gateway state changes matter less —
+# polls stretch to the idle interval and snap back on the next message.
+_IDLE_AFTER = timedelta(minutes=30)
+_IDLE_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL * 4)
+# Model info changes rarely (gateway restart, session switch) — refresh it
+# once per this many alive-pings instead of on every poll.
+_MODEL_POLL_EVERY = 10
+# Session activity is pushed from the message paths; the sessions_list poll
+# only reconciles drift once per this many cycles.
+_SESSIONS_POLL_EVERY = 20
+
+# Shared empty-sessions value; callers never mutate it.
+_EMPTY_SESSIONS: tuple = ()
+
+# Only this many session dicts are kept in coordinator data; the entities
+# show a short preview while DATA_SESSION_COUNT carries the true total, so
+# a busy gateway does not drag thousands of dicts through every data copy.
+_SESSIONS_PREVIEW_MAX = 20
+
+# How long the last successful poll keeps serving entities after the gateway
+# stops answering, before attributes blank out to the offline defaults.
+_STALE_TTL = timedelta(minutes=5)
+
 
 class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator that polls the OpenClaw gateway for status updates.
@@ -51,6 +86,27 @@ class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     - Model info cached separately with a longer poll interval
     """
 
+    # Static shape of a poll result; _offline_data copies this in one
+    # C-level allocation and patches only the keys that actually vary.
+    _OFFLINE_TEMPLATE: dict[str, Any] = {
+        DATA_STATUS: "offline",
+        DATA_CONNECTED: False,
+        DATA_SESSION_COUNT: 0,
+        DATA_SESSIONS: _EMPTY_SESSIONS,
+        DATA_MODEL: None,
+        DATA_LAST_ACTIVITY: None,
+        DATA_GATEWAY_VERSION: None,
+        DATA_UPTIME: None,
+        DATA_PROVIDER: None,
+        DATA_CONTEXT_WINDOW: None,
+        DATA_LAST_TOOL_NAME: None,
+        DATA_LAST_TOOL_STATUS: None,
+        DATA_LAST_TOOL_DURATION_MS: None,
+        DATA_LAST_TOOL_INVOKED_AT: None,
+        DATA_LAST_TOOL_ERROR: None,
+        DATA_LAST_TOOL_RESULT_PREVIEW: None,
+    }
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -61,13 +117,22 @@ class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=_DEFAULT_INTERVAL,
         )
         self.client = client
         self._last_activity: datetime | None = None
         self._model_cache: dict[str, Any] = {}
-        self._available_models: list[str] = []
+        self._available_models: tuple[str, ...] = ()
+        self._models_version = 0
         self._consecutive_failures = 0
+        self._base_interval = _DEFAULT_INTERVAL
+        self._rate_limited_ok_pending = 0
+        self._model_poll_counter = 0
+        self._cycle_count = 0
+        self._sessions_cache: dict[str, dict[str, Any]] = {}
+        self._last_good_data: dict[str, Any] | None = None
+        self._last_good_at: datetime | None = None
+        self._refresh_token: Callable[[], Awaitable[bool]] | None = None
         self._last_tool_state: dict[str, Any] = {
             DATA_LAST_TOOL_NAME: None,
             DATA_LAST_TOOL_STATUS: None,
@@ -76,27 +141,39 @@ class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             DATA_LAST_TOOL_ERROR: None,
             DATA_LAST_TOOL_RESULT_PREVIEW: None,
         }
+        # Coalesces entity updates from back-to-back tool invocations into a
+        # single async_set_updated_data call per cooldown window.
+        self._tool_state_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=0.1,
+            immediate=True,
+            function=self._push_current_data,
+        )
 
     def _offline_data(self) -> dict[str, Any]:
-        """Return a data dict representing the offline state."""
-        return {
-            DATA_STATUS: "offline",
-            DATA_CONNECTED: False,
-            DATA_SESSION_COUNT: 0,
-            DATA_SESSIONS: [],
-            DATA_MODEL: self._model_cache.get(DATA_MODEL),
-            DATA_LAST_ACTIVITY: self._last_activity,
-            DATA_GATEWAY_VERSION: None,
-            DATA_UPTIME: None,
-            DATA_PROVIDER: self._model_cache.get(DATA_PROVIDER),
-            DATA_CONTEXT_WINDOW: self._model_cache.get(DATA_CONTEXT_WINDOW),
-            DATA_LAST_TOOL_NAME: self._last_tool_state.get(DATA_LAST_TOOL_NAME),
-            DATA_LAST_TOOL_STATUS: self._last_tool_state.get(DATA_LAST_TOOL_STATUS),
-            DATA_LAST_TOOL_DURATION_MS: self._last_tool_state.get(DATA_LAST_TOOL_DURATION_MS),
-            DATA_LAST_TOOL_INVOKED_AT: self._last_tool_state.get(DATA_LAST_TOOL_INVOKED_AT),
-            DATA_LAST_TOOL_ERROR: self._last_tool_state.get(DATA_LAST_TOOL_ERROR),
-            DATA_LAST_TOOL_RESULT_PREVIEW: self._last_tool_state.get(DATA_LAST_TOOL_RESULT_PREVIEW),
-        }
+        """Return a data dict for a failed poll.
+
+        While the last successful poll is younger than the stale TTL its data
+        keeps serving the entities (marked ``stale``), so a single failed
+        cycle does not blank sessions/version attributes on dashboards.
+        """
+        if (
+            self._last_good_data is not None
+            and datetime.now(_UTC) - self._last_good_at < _STALE_TTL
+        ):
+            data = self._last_good_data.copy()
+            data[DATA_STATUS] = "stale"
+            data[DATA_CONNECTED] = False
+            data.update(self._last_tool_state)
+            data[DATA_LAST_ACTIVITY] = self._last_activity
+            return data
+
+        data = self._OFFLINE_TEMPLATE.copy()
+        data.update(self._model_cache)
+        data.update(self._last_tool_state)
+        data[DATA_LAST_ACTIVITY] = self._last_activity
+        return data
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the OpenClaw gateway.
@@ -117,27 +194,87 @@ class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not alive:
                 return data
 
+            # _offline_data already carries the correct defaults for every
+            # other key; only the two connectivity fields flip on success.
             data[DATA_STATUS] = "online"
             data[DATA_CONNECTED] = True
-            data[DATA_GATEWAY_VERSION] = None
-            data[DATA_UPTIME] = None
-            data[DATA_SESSION_COUNT] = 0
-            data[DATA_SESSIONS] = []
-            data[DATA_LAST_ACTIVITY] = self._last_activity
             self._consecutive_failures = 0
+            # After a 429 cooldown, hold the longer interval for a few clean
+            # cycles before tightening back to the base cadence. Otherwise
+            # the cadence follows recent chat activity: busy systems poll at
+            # the base interval, long-idle ones stretch out.
+            if self._rate_limited_ok_pending:
+                self._rate_limited_ok_pending -= 1
+            else:
+                idle = (
+                    self._last_activity is None
+                    or datetime.now(_UTC) - self._last_activity > _IDLE_AFTER
+                )
+                desired = _IDLE_INTERVAL if idle else self._base_interval
+                if self.update_interval != desired:
+                    self.update_interval = desired
 
         except OpenClawConnectionError:
             self._consecutive_failures += 1
             if self._consecutive_failures <= 3:
-                _LOGGER.debug("Gateway unreachable (attempt %d)", self._consecutive_failures)
+                # Inline isEnabledFor guard: skips LogRecord construction on
+                # every failed poll when debug logging is off.
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Gateway unreachable (attempt %d)", self._consecutive_failures
+                    )
             elif self._consecutive_failures == 4:
                 _LOGGER.warning(
                     "Gateway has been unreachable for %d consecutive polls",
                     self._consecutive_failures,
                 )
+            # Back off polling while the gateway stays down; the interval
+            # snaps back to the default on the first successful ping.
+            backoff = min(
+                self._base_interval.total_seconds()
+                * 2 ** min(self._consecutive_failures - 1, 6),
+                _MAX_BACKOFF_SECONDS,
+            )
+            interval = timedelta(seconds=backoff)
+            if self.update_interval != interval:
+                self.update_interval = interval
             return data
 
-        # ── Best-effort model info (/v1/models may not exist) ──────
+        # ── Tiered best-effort fetches ─────────────────────────────
+        # The alive ping stays hot every cycle; model info runs on its own
+        # slow cadence with the cache filling the gaps. Kept inside one
+        # coordinator — with a single device and a handful of entities, a
+        # full multi-coordinator split would add setup complexity for the
+        # same request pattern on the wire.
+        poll_models = self._model_poll_counter % _MODEL_POLL_EVERY == 0
+        self._model_poll_counter += 1
+        poll_sessions = self._cycle_count % _SESSIONS_POLL_EVERY == 0
+        self._cycle_count += 1
+        if poll_models and poll_sessions:
+            # The two fetches are independent — overlap their RTTs. Both
+            # handle their own errors and touch disjoint keys in ``data``.
+            await asyncio.gather(
+                self._async_fetch_models(data),
+                self._async_fetch_sessions(data),
+            )
+        elif poll_models:
+            await self._async_fetch_models(data)
+        elif poll_sessions:
+            await self._async_fetch_sessions(data)
+
+        if not poll_sessions and self._sessions_cache:
+            # Idle cycles serve the push-maintained session cache instead of
+            # issuing a sessions_list request.
+            cached_sessions = list(self._sessions_cache.values())
+            data[DATA_SESSIONS] = cached_sessions[:_SESSIONS_PREVIEW_MAX]
+            data[DATA_SESSION_COUNT] = len(cached_sessions)
+
+        self._last_good_data = data.copy()
+        self._last_good_at = datetime.now(_UTC)
+        return data
+
+    async def _async_fetch_models(self, data: dict[str, Any]) -> None:
+        """Best-effort model info fetch (/v1/models may not exist)."""
         try:
             models_resp = await self.client.async_get_models()
             models = models_resp.get("data", [])
@@ -148,17 +285,27 @@ class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     DATA_PROVIDER: current.get("owned_by"),
                     DATA_CONTEXT_WINDOW: current.get("context_window"),
                 }
-                self._available_models = [
+                available = tuple(
                     m.get("id") for m in models if m.get("id")
-                ]
+                )
+                if available != self._available_models:
+                    # Bump the version only on real change so entities can
+                    # skip rebuilding their options on identical polls.
+                    self._available_models = available
+                    self._models_version += 1
+                # Refresh the already-applied cached values in-place.
+                data.update(self._model_cache)
         except OpenClawAuthError as err:
             _LOGGER.warning("Gateway auth failed during poll: %s", err)
             await self._try_refresh_token()
-        except OpenClawApiError:
+            # Force a model refresh on the next poll after the refresh.
+            self._model_poll_counter = 0
+        except OpenClawApiError as err:
             # /v1/models not implemented — expected, not an error
-            pass
+            self._note_rate_limit(err)
 
-        # ── Best-effort sessions_list via tools invoke ──────────────
+    async def _async_fetch_sessions(self, data: dict[str, Any]) -> None:
+        """Best-effort sessions_list fetch via the tools endpoint."""
         try:
             tool_resp = await self.client.async_invoke_tool(
                 tool="sessions_list",
@@ -175,38 +322,86 @@ class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     sessions = [item for item in candidates if isinstance(item, dict)]
 
             if sessions:
-                data[DATA_SESSIONS] = sessions
+                self._sessions_cache = {
+                    str(item.get("id", index)): item
+                    for index, item in enumerate(sessions)
+                }
+                data[DATA_SESSIONS] = sessions[:_SESSIONS_PREVIEW_MAX]
                 data[DATA_SESSION_COUNT] = len(sessions)
-        except OpenClawApiError:
+        except OpenClawApiError as err:
             # tools endpoint may be policy-limited; not fatal
-            pass
+            self._note_rate_limit(err)
 
-        data.update(self._model_cache)
-        data.update(self._last_tool_state)
-        return data
+    def _note_rate_limit(self, err: OpenClawApiError) -> None:
+        """Apply a poll cooldown when the gateway signals rate limiting."""
+        if getattr(err, "status_code", None) != 429:
+            return
+        cooldown = max(_RATE_LIMIT_MIN_COOLDOWN, err.retry_after or 0.0)
+        interval = timedelta(seconds=cooldown)
+        if self.update_interval != interval:
+            _LOGGER.debug("Gateway rate limited — cooling polls to %ss", cooldown)
+            self.update_interval = interval
+        self._rate_limited_ok_pending = _RATE_LIMIT_OK_CYCLES
+
+    def set_refresh_token(
+        self, refresh_fn: Callable[[], Awaitable[bool]]
+    ) -> None:
+        """Register this entry's token refresh callback."""
+        self._refresh_token = refresh_fn
 
     async def _try_refresh_token(self) -> None:
         """Attempt to re-read the gateway token via the refresh callback."""
-        entry_data = self.hass.data.get(DOMAIN, {})
-        for eid, ed in entry_data.items():
-            if isinstance(ed, dict) and "refresh_token" in ed:
-                refresh_fn = ed["refresh_token"]
-                if await refresh_fn():
-                    _LOGGER.info("Token refreshed successfully — next poll should succeed")
-                    return
-        _LOGGER.debug("No token refresh callback available")
-
-    def update_last_activity(self) -> None:
+        if self._refresh_token is not None:
+            if await self._refresh_token():
+                _LOGGER.info("Token refreshed successfully — next poll should succeed")
+            return
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("No token refresh callback available")
+
+    def record_session_activity(self, session_id: str) -> None:
+        """Record chat activity pushed from the message paths.
+
+        Keeps the session cache warm between reconciliation polls so an
+        idle system needs no sessions_list request to stay accurate. Only
+        a previously unseen session triggers an entity update.
+        """
+        if not session_id or session_id in self._sessions_cache:
+            return
+        self._sessions_cache[session_id] = {"id": session_id}
+        if self.data is not None:
+            current = self.data.copy()
+            sessions = list(self._sessions_cache.values())
+            current[DATA_SESSIONS] = sessions[:_SESSIONS_PREVIEW_MAX]
+            current[DATA_SESSION_COUNT] = len(sessions)
+            self.async_set_updated_data(current)
+
+    def update_last_activity(self, _now=datetime.now, _utc=_UTC) -> None:
         """Update the last activity timestamp to now.
 
         Called when a message is sent/received through the integration.
+        The defaulted kwargs turn the global datetime/timezone lookups into
+        LOAD_FAST locals on this per-message path.
         """
-        self._last_activity = datetime.now(timezone.utc)
+        self._last_activity = _now(_utc)
+        # Activity ends an idle stretch immediately rather than waiting for
+        # the next (slow) poll to notice.
+        if self.update_interval == _IDLE_INTERVAL:
+            self.update_interval = self._base_interval
+
+    @property
+    def last_update_success_time(self) -> datetime | None:
+        """Return when the last fully successful poll completed."""
+        return self._last_good_at
+
+    @property
+    def available_models(self) -> tuple[str, ...]:
+        """Return the model IDs from the last successful poll."""
+        return self._available_models
 
     @property
-    def available_models(self) -> list[str]:
-        """Return the list of model IDs from the last successful poll."""
-        return list(self._available_models)
+    def models_version(self) -> int:
+        """Return a counter that bumps whenever the model list changes."""
+        return self._models_version
 
     def record_tool_invocation(
         self,
@@ -216,16 +411,30 @@ class OpenClawCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         duration_ms: int,
         error_message: str | None = None,
         result_preview: str | None = None,
+        _now=datetime.now,
+        _utc=_UTC,
     ) -> None:
         """Store latest tool invocation metadata and update entities immediately."""
         self._last_tool_state = {
             DATA_LAST_TOOL_NAME: tool_name,
             DATA_LAST_TOOL_STATUS: "ok" if ok else "error",
             DATA_LAST_TOOL_DURATION_MS: duration_ms,
-            DATA_LAST_TOOL_INVOKED_AT: datetime.now(timezone.utc),
+            DATA_LAST_TOOL_INVOKED_AT: _now(_utc),
             DATA_LAST_TOOL_ERROR: error_message,
             DATA_LAST_TOOL_RESULT_PREVIEW: result_preview,
         }
-        current = dict(self.data or self._offline_data())
+        self._tool_state_debouncer.async_schedule_call()
+
+    async def _push_current_data(self) -> None:
+        """Publish the current data merged with the latest tool state."""
+        if self.data is None:
+            current = self._offline_data()
+        else:
+            current = self.data.copy()
         current.update(self._last_tool_state)
         self.async_set_updated_data(current)
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending debounced tool-state push and shut down."""
+        self._tool_state_debouncer.async_cancel()
+        await super().async_shutdown()
@@ -10,14 +10,17 @@ that are selectable in the automation UI (no YAML needed).
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components.event import EventEntity, EventEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
+    ATTR_ENTRY_ID,
     DOMAIN,
     EVENT_MESSAGE_RECEIVED,
     EVENT_TOOL_INVOKED,
@@ -41,14 +44,34 @@ EVENT_DESCRIPTIONS: tuple[EventEntityDescription, ...] = (
 )
 
 
+def _dispatch_message_received(entity: OpenClawEventEntity, data: dict[str, Any]) -> None:
+    entity._trigger_event("message_received", data)
+
+
+def _dispatch_tool_invoked(entity: OpenClawEventEntity, data: dict[str, Any]) -> None:
+    event_type = "tool_invoked_ok" if data.get("ok", False) else "tool_invoked_error"
+    entity._trigger_event(event_type, data)
+
+
+# Bus event and dispatcher per entity key, resolved once at listener
+# registration instead of string-comparing the key on every bus event.
+_EVENT_DISPATCH: dict[
+    str, tuple[str, Callable[[OpenClawEventEntity, dict[str, Any]], None]]
+] = {
+    "message_received": (EVENT_MESSAGE_RECEIVED, _dispatch_message_received),
+    "tool_invoked": (EVENT_TOOL_INVOKED, _dispatch_tool_invoked),
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up OpenClaw event entities from a config entry."""
+    device_info: DeviceInfo = hass.data[DOMAIN][entry.entry_id]["device_info"]
     entities = [
-        OpenClawEventEntity(entry, description)
+        OpenClawEventEntity(entry, description, device_info)
         for description in EVENT_DESCRIPTIONS
     ]
     async_add_entities(entities)
@@ -63,42 +86,38 @@ class OpenClawEventEntity(EventEntity):
         self,
         entry: ConfigEntry,
         description: EventEntityDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the event entity."""
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "OpenClaw Assistant",
-            "manufacturer": "OpenClaw",
-            "model": "OpenClaw Gateway",
-        }
+        self._attr_device_info = device_info
         self._entry_id = entry.entry_id
         self._unsub = None
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to the matching HA bus event after the entity is added."""
-        key = self.entity_description.key
-
-        if key == "message_received":
-            bus_event = EVENT_MESSAGE_RECEIVED
-        elif key == "tool_invoked":
-            bus_event = EVENT_TOOL_INVOKED
-        else:
+        dispatch_entry = _EVENT_DISPATCH.get(self.entity_description.key)
+        if dispatch_entry is None:
             return
+        bus_event, dispatch = dispatch_entry
+        entry_id = self._entry_id
+
+        @callback
+        def _event_filter(event_data: dict[str, Any]) -> bool:
+            # Drop events for other entries before dispatch; events without
+            # an entry_id (older producers) are accepted for compatibility.
+            event_entry_id = event_data.get(ATTR_ENTRY_ID)
+            return event_entry_id is None or event_entry_id == entry_id
 
         @callback
         def _handle_event(event) -> None:
-            data: dict[str, Any] = dict(event.data or {})
-            if key == "message_received":
-                self._trigger_event("message_received", data)
-            elif key == "tool_invoked":
-                ok = data.get("ok", False)
-                event_type = "tool_invoked_ok" if ok else "tool_invoked_error"
-                self._trigger_event(event_type, data)
+            dispatch(self, dict(event.data or {}))
             self.async_write_ha_state()
 
-        self._unsub = self.hass.bus.async_listen(bus_event, _handle_event)
+        self._unsub = self.hass.bus.async_listen(
+            bus_event, _handle_event, event_filter=_event_filter
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe when entity is removed."""
@@ -2,10 +2,64 @@
 
 from __future__ import annotations
 
-from collections import Counter
+import functools
+import heapq
+import time
 
 from homeassistant.components.homeassistant import async_should_expose
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+
+
+class _ExposureCache:
+    """Short-lived cache of exposed entity ids per assistant.
+
+    async_should_expose walks settings/registry data per entity; during a
+    multi-turn conversation the same exposure answers are recomputed within
+    seconds. The cache holds the resulting id sets briefly and is flushed
+    immediately when the entity registry changes.
+    """
+
+    __slots__ = ("stamp_ns", "by_assistant", "listener_registered")
+
+    def __init__(self) -> None:
+        self.stamp_ns = 0
+        self.by_assistant: dict[str, frozenset[str]] = {}
+        self.listener_registered = False
+
+
+_CACHE_TTL_NS = 5_000_000_000  # 5 seconds
+_CACHE = _ExposureCache()
+
+# Bound %-formatter for entity lines — one C-level call per entity instead
+# of f-string assembly in the loop body.
+_ENTITY_TMPL = "  - id: %s; name: %s; state: %s".__mod__
+
+
+@callback
+def _async_registry_updated(event: Event) -> None:
+    """Flush the exposure cache when the entity registry changes."""
+    _CACHE.stamp_ns = 0
+    _CACHE.by_assistant.clear()
+
+
+def _get_cached_ids(hass: HomeAssistant, assistant_value: str) -> frozenset[str] | None:
+    """Return the cached exposed-id set for an assistant, if still fresh."""
+    if not _CACHE.listener_registered:
+        _CACHE.listener_registered = True
+        hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated)
+    if time.monotonic_ns() - _CACHE.stamp_ns >= _CACHE_TTL_NS:
+        return None
+    return _CACHE.by_assistant.get(assistant_value)
+
+
+def _store_cached_ids(assistant_value: str, entity_ids: frozenset[str]) -> None:
+    """Store an exposed-id set, restarting the TTL window when expired."""
+    now_ns = time.monotonic_ns()
+    if now_ns - _CACHE.stamp_ns >= _CACHE_TTL_NS:
+        _CACHE.by_assistant.clear()
+        _CACHE.stamp_ns = now_ns
+    _CACHE.by_assistant[assistant_value] = entity_ids
 
 
 def build_exposed_entities_context(
@@ -19,41 +73,86 @@ def build_exposed_entities_context(
     """
     assistant_id = assistant or "conversation"
 
-    def _collect_for(assistant_value: str) -> list:
-        return [
-            state
-            for state in hass.states.async_all()
-            if async_should_expose(hass, assistant_value, state.entity_id)
-        ]
-
-    exposed_states = _collect_for(assistant_id)
-
-    if not exposed_states and assistant_id != "conversation":
-        exposed_states = _collect_for("conversation")
+    def _collect_for(assistants: tuple[str, ...]) -> tuple[list, dict[str, int]]:
+        """Collect exposed states for the first assistant id with matches.
+
+        Walks the state machine once, testing every assistant id per state,
+        so the "conversation" fallback does not trigger a second full sweep.
+        Filtering and domain counting are fused into the same loop, and a
+        fresh cache turns the per-entity exposure check into set membership.
+        """
+        buckets: dict[str, tuple[list, dict[str, int]]] = {
+            assistant_value: ([], {}) for assistant_value in assistants
+        }
+        cached = {
+            assistant_value: _get_cached_ids(hass, assistant_value)
+            for assistant_value in assistants
+        }
+        to_cache: dict[str, list[str]] = {
+            assistant_value: []
+            for assistant_value in assistants
+            if cached[assistant_value] is None
+        }
+
+        for state in hass.states.async_all():
+            entity_id = state.entity_id
+            for assistant_value in assistants:
+                cached_ids = cached[assistant_value]
+                if cached_ids is not None:
+                    exposed = entity_id in cached_ids
+                else:
+                    exposed = async_should_expose(hass, assistant_value, entity_id)
+                    if exposed:
+                        to_cache[assistant_value].append(entity_id)
+                if exposed:
+                    states, counts = buckets[assistant_value]
+                    states.append(state)
+                    counts[state.domain] = counts.get(state.domain, 0) + 1
+
+        for assistant_value, exposed_ids in to_cache.items():
+            _store_cached_ids(assistant_value, frozenset(exposed_ids))
+
+        for assistant_value in assistants:
+            states, counts = buckets[assistant_value]
+            if states:
+                return states, counts
+        return [], {}
+
+    if assistant_id != "conversation":
+        exposed_states, domain_counts = _collect_for((assistant_id, "conversation"))
+    else:
+        exposed_states, domain_counts = _collect_for((assistant_id,))
 
     if not exposed_states:
         return None
 
-    exposed_states.sort(key=lambda state: state.entity_id)
-    domain_counts = Counter(state.domain for state in exposed_states)
+    total_exposed = len(exposed_states)
+    if total_exposed > max_entities:
+        # Only max_entities survive the cut — O(N log K) partial selection
+        # instead of sorting the whole exposed list.
+        top_states = heapq.nsmallest(
+            max_entities, exposed_states, key=lambda state: state.entity_id
+        )
+    else:
+        exposed_states.sort(key=lambda state: state.entity_id)
+        top_states = exposed_states
 
     lines: list[str] = [
         "Home Assistant live context (entities exposed to this assistant):",
-        f"- total_exposed_entities: {len(exposed_states)}",
+        f"- total_exposed_entities: {total_exposed}",
         "- domain_counts:",
     ]
     lines.extend(f"  - {domain}: {count}" for domain, count in sorted(domain_counts.items()))
     lines.append("- entities:")
 
-    for state in exposed_states[:max_entities]:
-        friendly_name = state.name or state.entity_id
-        lines.append(
-            f"  - id: {state.entity_id}; name: {friendly_name}; state: {state.state}"
-        )
+    lines.extend(
+        _ENTITY_TMPL((state.entity_id, state.name or state.entity_id, state.state))
+        for state in top_states
+    )
 
-    if len(exposed_states) > max_entities:
+    if total_exposed > max_entities:
         lines.append(
-            f"  - ... {len(exposed_states) - max_entities} additional exposed entities omitted"
+            f"  - ... {total_exposed - max_entities} additional exposed entities omitted"
         )
 
     lines.append(
@@ -81,6 +180,17 @@ def apply_context_policy(
     if strategy == "clear":
         return None
 
+    return _truncate(context_text, max_chars)
+
+
+@functools.lru_cache(maxsize=8)
+def _truncate(context_text: str, max_chars: int) -> str:
+    """Slice a long context block down to max_chars, keeping the tail.
+
+    The same system prompt is re-truncated on every conversation turn;
+    the small LRU returns the previously built slice instead of
+    reallocating it each call.
+    """
     marker = "\n[Context truncated to fit configured max length]\n"
     available = max_chars - len(marker)
     if available <= 0:
@@ -2,51 +2,115 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from datetime import datetime, timezone
+import time
 from typing import Any
 
+# Hoisted out of extract_text_recursive so the dict branch does not rebuild
+# the tuple per call; the frozenset gives a single C-level intersection to
+# detect whether any priority key is present before probing them one by one.
+_PRIORITY_KEYS = (
+    "output_text",
+    "text",
+    "content",
+    "message",
+    "response",
+    "answer",
+    "choices",
+    "output",
+    "delta",
+)
+_PRIORITY_KEYSET = frozenset(_PRIORITY_KEYS)
+
+_MAX_DEPTH = 8
+
+# Per-second cache for the event-payload timestamp: datetime construction
+# plus isoformat costs several microseconds per call, and second resolution
+# is plenty for bus events.
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def utcnow_isoformat() -> str:
+    """Return the current UTC time as an ISO string, cached per second."""
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_sec = sec
+        _last_ts_str = datetime.fromtimestamp(sec, tz=timezone.utc).isoformat()
+    return _last_ts_str
+
+
+# Monomorphic per-type helpers: each call site below only ever sees one
+# concrete type, which lets CPython 3.11+'s adaptive interpreter (PEP 659)
+# stabilize its inline caches instead of flip-flopping between shapes.
+
+
+def _strip_text(value: str) -> str | None:
+    """Strip a string leaf, mapping blank strings to None."""
+    text = value.strip()
+    return text or None
+
+
+def _dict_candidates(value: dict[Any, Any]) -> Iterator[Any]:
+    """Yield a dict's child values in extraction priority order."""
+    if _PRIORITY_KEYSET & value.keys():
+        for key in _PRIORITY_KEYS:
+            if key in value:
+                yield value[key]
+    yield from value.values()
+
 
 def extract_text_recursive(value: Any, depth: int = 0) -> str | None:
-    """Recursively extract assistant text from nested response payloads."""
-    if depth > 8:
-        return None
-
-    if isinstance(value, str):
-        text = value.strip()
-        return text or None
-
-    if isinstance(value, list):
-        parts: list[str] = []
-        for item in value:
-            extracted = extract_text_recursive(item, depth + 1)
-            if extracted:
-                parts.append(extracted)
-        if parts:
-            return "\n".join(parts)
-        return None
-
-    if isinstance(value, dict):
-        priority_keys = (
-            "output_text",
-            "text",
-            "content",
-            "message",
-            "response",
-            "answer",
-            "choices",
-            "output",
-            "delta",
-        )
-
-        for key in priority_keys:
-            if key not in value:
-                continue
-            extracted = extract_text_recursive(value.get(key), depth + 1)
-            if extracted:
-                return extracted
+    """Extract assistant text from nested response payloads.
+
+    Iterative depth-first walk — an explicit stack avoids a Python frame per
+    node on deeply nested provider payloads. Semantics are unchanged from the
+    recursive version: strings are stripped, the first non-empty result wins
+    inside dicts, list results are joined with newlines, and nodes deeper
+    than eight levels are ignored.
+    """
+    # Frames are (child_iterator, parts): parts is None for dicts (first
+    # non-empty child result wins) and a list for lists (results joined).
+    stack: list[tuple[Iterator[Any], list[str] | None]] = []
+    result: str | None = None
 
-        for nested_value in value.values():
-            extracted = extract_text_recursive(nested_value, depth + 1)
-            if extracted:
-                return extracted
+    while True:
+        # Evaluate the current value; containers push a frame.
+        value_type = type(value)
+        if depth + len(stack) > _MAX_DEPTH:
+            result = None
+        elif value_type is str or isinstance(value, str):
+            result = _strip_text(value)
+        elif value_type is list or isinstance(value, list):
+            stack.append((iter(value), []))
+            result = None
+        elif value_type is dict or isinstance(value, dict):
+            stack.append((_dict_candidates(value), None))
+            result = None
+        else:
+            result = None
 
-    return None
+        # Pump frames until a new value needs evaluating.
+        while True:
+            if not stack:
+                return result
+            child_iter, parts = stack[-1]
+            if result:
+                if parts is None:
+                    # Dict frame: first non-empty result propagates up.
+                    stack.pop()
+                    continue
+                parts.append(result)
+                result = None
+            try:
+                value = next(child_iter)
+            except StopIteration:
+                stack.pop()
+                if parts is not None and parts:
+                    result = "\n".join(parts)
+                else:
+                    result = None
+                continue
+            break
@@ -13,6 +13,7 @@ from typing import Any
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -39,9 +40,10 @@ async def async_setup_entry(
     """Set up OpenClaw select entities from a config entry."""
     entry_data: dict = hass.data[DOMAIN][entry.entry_id]
     coordinator: OpenClawCoordinator = entry_data["coordinator"]
+    device_info: DeviceInfo = entry_data["device_info"]
 
     entities = [
-        OpenClawModelSelect(coordinator, description, entry)
+        OpenClawModelSelect(coordinator, description, entry, device_info)
         for description in SELECT_DESCRIPTIONS
     ]
     async_add_entities(entities)
@@ -57,21 +59,18 @@ class OpenClawModelSelect(CoordinatorEntity[OpenClawCoordinator], SelectEntity):
         coordinator: OpenClawCoordinator,
         description: SelectEntityDescription,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
         self.entity_description = description
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "OpenClaw Assistant",
-            "manufacturer": "OpenClaw",
-            "model": "OpenClaw Gateway",
-        }
+        self._attr_device_info = device_info
         # Initialise from coordinator cache
+        self._models_version = coordinator.models_version
         models = coordinator.available_models
-        self._attr_options = models if models else ["unknown"]
+        self._attr_options = list(models) if models else ["unknown"]
         current = (coordinator.data or {}).get(DATA_MODEL)
         self._attr_current_option = current if current in self._attr_options else (
             self._attr_options[0] if self._attr_options else None
@@ -79,14 +78,30 @@ class OpenClawModelSelect(CoordinatorEntity[OpenClawCoordinator], SelectEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Update options and current selection when coordinator refreshes."""
-        models = self.coordinator.available_models
-        if models:
-            self._attr_options = models
+        """Update options and current selection when coordinator refreshes.
+
+        Most polls leave both the model list and the active model untouched;
+        the version check skips rebuilding options and the state write is
+        only issued when something actually changed.
+        """
+        changed = False
+        version = self.coordinator.models_version
+        if version != self._models_version:
+            self._models_version = version
+            models = self.coordinator.available_models
+            if models:
+                self._attr_options = list(models)
+                changed = True
         current = (self.coordinator.data or {}).get(DATA_MODEL)
-        if current and current in self._attr_options:
+        if (
+            current
+            and current != self._attr_current_option
+            and current in self._attr_options
+        ):
             self._attr_current_option = current
-        self.async_write_ha_state()
+            changed = True
+        if changed:
+            self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
         """Handle the user selecting a new model.
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,6 +14,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -90,16 +93,71 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
 )
 
 
+def _status_attrs(coordinator: OpenClawCoordinator, data: dict) -> dict[str, Any]:
+    return {
+        "gateway_version": data.get(DATA_GATEWAY_VERSION),
+        "uptime": data.get(DATA_UPTIME),
+        "last_successful_poll": coordinator.last_update_success_time,
+    }
+
+
+def _session_attrs(coordinator: OpenClawCoordinator, data: dict) -> dict[str, Any]:
+    sessions = data.get(DATA_SESSIONS) or ()
+    return {
+        "sessions": [s.get("id", "unknown") for s in islice(sessions, 10)],
+        "sessions_truncated": data.get(DATA_SESSION_COUNT, 0) > len(sessions),
+    }
+
+
+def _model_attrs(coordinator: OpenClawCoordinator, data: dict) -> dict[str, Any]:
+    return {
+        "provider": data.get(DATA_PROVIDER),
+    }
+
+
+def _activity_attrs(coordinator: OpenClawCoordinator, data: dict) -> dict[str, Any]:
+    return {
+        "last_message_preview": None,  # TODO: populate from last message
+    }
+
+
+# Sensor keys that all share the last-tool attribute set.
+_TOOL_KEYS: Final[frozenset[str]] = frozenset(
+    {DATA_LAST_TOOL_NAME, DATA_LAST_TOOL_STATUS, DATA_LAST_TOOL_DURATION_MS}
+)
+
+
+def _tool_attrs(coordinator: OpenClawCoordinator, data: dict) -> dict[str, Any]:
+    return {
+        "error": data.get(DATA_LAST_TOOL_ERROR),
+        "result_preview": data.get(DATA_LAST_TOOL_RESULT_PREVIEW),
+        "invoked_at": data.get(DATA_LAST_TOOL_INVOKED_AT),
+    }
+
+
+# Attribute builder per sensor key — a single dict lookup on each property
+# read instead of walking an if/elif ladder of string compares.
+_ATTR_BUILDERS: dict[str, Callable[[OpenClawCoordinator, dict], dict[str, Any]]] = {
+    DATA_STATUS: _status_attrs,
+    DATA_SESSION_COUNT: _session_attrs,
+    DATA_MODEL: _model_attrs,
+    DATA_LAST_ACTIVITY: _activity_attrs,
+}
+_ATTR_BUILDERS.update(dict.fromkeys(_TOOL_KEYS, _tool_attrs))
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up OpenClaw sensors from a config entry."""
-    coordinator: OpenClawCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    entry_data: dict = hass.data[DOMAIN][entry.entry_id]
+    coordinator: OpenClawCoordinator = entry_data["coordinator"]
+    device_info: DeviceInfo = entry_data["device_info"]
 
     entities = [
-        OpenClawSensor(coordinator, description, entry)
+        OpenClawSensor(coordinator, description, entry, device_info)
         for description in SENSOR_DESCRIPTIONS
     ]
 
@@ -116,18 +174,13 @@ class OpenClawSensor(CoordinatorEntity[OpenClawCoordinator], SensorEntity):
         coordinator: OpenClawCoordinator,
         description: SensorEntityDescription,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "OpenClaw Assistant",
-            "manufacturer": "OpenClaw",
-            "model": "OpenClaw Gateway",
-            "sw_version": coordinator.data.get(DATA_GATEWAY_VERSION) if coordinator.data else None,
-        }
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> str | int | datetime | None:
@@ -139,39 +192,11 @@ class OpenClawSensor(CoordinatorEntity[OpenClawCoordinator], SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional attributes based on sensor type."""
-        if not self.coordinator.data:
-            return None
-
-        key = self.entity_description.key
         data = self.coordinator.data
+        if not data:
+            return None
 
-        if key == DATA_STATUS:
-            return {
-                "gateway_version": data.get(DATA_GATEWAY_VERSION),
-                "uptime": data.get(DATA_UPTIME),
-            }
-
-        if key == DATA_SESSION_COUNT:
-            sessions = data.get(DATA_SESSIONS, [])
-            return {
-                "sessions": [s.get("id", "unknown") for s in sessions[:10]],
-            }
-
-        if key == DATA_MODEL:
-            return {
-                "provider": data.get(DATA_PROVIDER),
-            }
-
-        if key == DATA_LAST_ACTIVITY:
-            return {
-                "last_message_preview": None,  # TODO: populate from last message
-            }
-
-        if key in {DATA_LAST_TOOL_NAME, DATA_LAST_TOOL_STATUS, DATA_LAST_TOOL_DURATION_MS}:
-            return {
-                "error": data.get(DATA_LAST_TOOL_ERROR),
-                "result_preview": data.get(DATA_LAST_TOOL_RESULT_PREVIEW),
-                "invoked_at": data.get(DATA_LAST_TOOL_INVOKED_AT),
-            }
-
-        return None
+        builder = _ATTR_BUILDERS.get(self.entity_description.key)
+        if builder is None:
+            return None
+        return builder(self.coordinator, data)